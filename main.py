@@ -6,9 +6,46 @@ Uses pre-calculated SFD and BMD data from Excel
 
 import pandas as pd
 import numpy as np
-from pylatex import Document, Section, Subsection, Figure, NoEscape, Package
-from pylatex.utils import bold
+import concurrent.futures
+import hashlib
+import io
 import os
+import shutil
+import subprocess
+import tempfile
+
+
+# Static LaTeX preamble, built once at import instead of per report
+_PREAMBLE = r"""\documentclass{article}
+\usepackage[margin=1in]{geometry}
+\usepackage[T1]{fontenc}
+\usepackage[utf8]{inputenc}
+\usepackage{lmodern}
+\usepackage{textcomp}
+\usepackage{graphicx}
+\usepackage{pgfplots}
+\usepackage{tikz}
+\pgfplotsset{compat=1.18}
+\title{Beam Analysis Report \\ Simply Supported Beam}
+\author{Generated using PyLaTeX}
+\date{}
+\begin{document}
+\maketitle
+"""
+
+
+def write_parquet_cache(df, cache_path):
+    """
+    Write the beam data to a parquet cache next to the Excel file
+
+    Args:
+        df: DataFrame with beam analysis data
+        cache_path: Path where the parquet cache should be written
+    """
+    try:
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+    except Exception as e:
+        print(f"Could not write parquet cache: {e}")
 
 
 def read_beam_data(excel_path):
@@ -21,29 +58,107 @@ def read_beam_data(excel_path):
     Returns:
         DataFrame with beam analysis data
     """
+    cache_path = excel_path + ".parquet"
     try:
-        df = pd.read_excel(excel_path)
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+            df = pd.read_parquet(cache_path, engine="pyarrow", dtype_backend="pyarrow")
+            print(f"Loaded {len(df)} data points from parquet cache")
+            return df
+    except Exception as e:
+        print(f"Could not use parquet cache ({e}), reading Excel file...")
+
+    try:
+        df = pd.read_excel(
+            excel_path,
+            engine="calamine",
+            usecols=["x", "Shear force", "Bending Moment"],
+            dtype={"x": "float32[pyarrow]", "Shear force": "float32[pyarrow]", "Bending Moment": "float32[pyarrow]"},
+        )
         print(f"Successfully read {len(df)} data points from Excel file")
         print(f"Columns: {df.columns.tolist()}")
+        write_parquet_cache(df, cache_path)
         return df
     except Exception as e:
-        print(f"Error reading Excel file: {e}")
-        return None
+        print(f"Calamine engine unavailable ({e}), falling back to openpyxl...")
+        try:
+            df = pd.read_excel(
+                excel_path,
+                engine="openpyxl",
+                usecols=["x", "Shear force", "Bending Moment"],
+                dtype={"x": "float32", "Shear force": "float32", "Bending Moment": "float32"},
+            )
+            print(f"Successfully read {len(df)} data points from Excel file")
+            print(f"Columns: {df.columns.tolist()}")
+            write_parquet_cache(df, cache_path)
+            return df
+        except Exception as e:
+            print(f"Error reading Excel file: {e}")
+            return None
 
 
-def create_tikz_sfd(x_data, y_data):
+def _decimate(x_data, y_data, n=200):
+    """
+    Downsample a plotted series to at most roughly n points
+
+    Stride-samples the arrays while always keeping the endpoints and the
+    minimum/maximum of y, so the plotted curve keeps its extremes. TikZ
+    compile time grows with the number of emitted coordinates, so large
+    frames are thinned before emission.
+
+    Args:
+        x_data: Array-like of x coordinates
+        y_data: Array-like of y values
+        n: Target number of points to keep
+
+    Returns:
+        Tuple of (x, y) NumPy arrays with the reduced series
+    """
+    xs = np.asarray(x_data)
+    ys = np.asarray(y_data)
+
+    if len(xs) <= n:
+        return xs, ys
+
+    stride = int(np.ceil(len(xs) / n))
+    keep = np.arange(0, len(xs), stride)
+    forced = np.array([0, len(xs) - 1, int(np.argmin(ys)), int(np.argmax(ys))])
+    keep = np.unique(np.concatenate([keep, forced]))
+    return xs[keep], ys[keep]
+
+
+def write_plot_data(x_data, y_data, dat_path):
+    """
+    Write a decimated x/y series to a plain-text data file for pgfplots
+
+    The rows are formatted into an in-memory buffer first so the file is
+    written with a single write call instead of one per line.
+
+    Args:
+        x_data: Array-like of x coordinates
+        y_data: Array-like of y values
+        dat_path: Path where the .dat file should be written
+    """
+    xs, ys = _decimate(x_data, y_data)
+    buf = io.StringIO()
+    np.savetxt(buf, np.c_[xs, ys], fmt="%.6g", header="x y", comments="")
+    with open(dat_path, 'w', encoding='utf-8') as f:
+        f.write(buf.getvalue())
+
+
+def create_tikz_sfd(x_data, y_data, dat_path):
     """
     Create TikZ code for Shear Force Diagram
-    
+
     Args:
         x_data: List of x coordinates
         y_data: List of shear force values
-        
+        dat_path: Path where the plot data file should be written
+
     Returns:
         LaTeX string with TikZ code
     """
-    coordinates = " ".join([f"({x},{y})" for x, y in zip(x_data, y_data)])
-    
+    write_plot_data(x_data, y_data, dat_path)
+
     tikz_code = r"""
 \begin{center}
 \begin{tikzpicture}
@@ -56,9 +171,7 @@ def create_tikz_sfd(x_data, y_data):
         legend pos=north east,
         axis lines=middle,
     ]
-    \addplot[blue, thick, smooth] coordinates {
-        """ + coordinates + r"""
-    };
+    \addplot[blue, thick, smooth] table[x=x, y=y] {""" + os.path.basename(dat_path) + r"""};
     \addlegendentry{Shear Force}
     \end{axis}
 \end{tikzpicture}
@@ -67,19 +180,20 @@ def create_tikz_sfd(x_data, y_data):
     return tikz_code
 
 
-def create_tikz_bmd(x_data, y_data):
+def create_tikz_bmd(x_data, y_data, dat_path):
     """
     Create TikZ code for Bending Moment Diagram
-    
+
     Args:
         x_data: List of x coordinates
         y_data: List of bending moment values
-        
+        dat_path: Path where the plot data file should be written
+
     Returns:
         LaTeX string with TikZ code
     """
-    coordinates = " ".join([f"({x},{y:.2f})" for x, y in zip(x_data, y_data)])
-    
+    write_plot_data(x_data, y_data, dat_path)
+
     tikz_code = r"""
 \begin{center}
 \begin{tikzpicture}
@@ -92,9 +206,7 @@ def create_tikz_bmd(x_data, y_data):
         legend pos=north east,
         axis lines=middle,
     ]
-    \addplot[red, thick, smooth] coordinates {
-        """ + coordinates + r"""
-    };
+    \addplot[red, thick, smooth] table[x=x, y=y] {""" + os.path.basename(dat_path) + r"""};
     \addlegendentry{Bending Moment}
     \end{axis}
 \end{tikzpicture}
@@ -113,154 +225,238 @@ def create_data_table(beam_df):
     Returns:
         LaTeX string with tabular code
     """
+    step = 1 if len(beam_df) <= 15 else 2
+
+    sub = beam_df.iloc[::step][['x', 'Shear force', 'Bending Moment']].copy()
+    sub['x'] = np.char.mod('%.1f', sub['x'].to_numpy())
+    rows = sub.to_csv(sep='&', header=False, index=False, float_format='%.2f',
+                      lineterminator=' \\\\\n\\hline\n')
+
     table_code = r"""
 \begin{center}
 \begin{tabular}{|c|c|c|}
 \hline
 \textbf{Position (m)} & \textbf{Shear Force (kN)} & \textbf{Bending Moment (kN·m)} \\
 \hline
-"""
-    
-    step = 1 if len(beam_df) <= 15 else 2
-    
-    for idx, row in beam_df.iloc[::step].iterrows():
-        table_code += f"{row['x']:.1f} & {row['Shear force']:.2f} & {row['Bending Moment']:.2f} \\\\\n\\hline\n"
-    
-    table_code += r"""
-\end{tabular}
+""" + rows + r"""\end{tabular}
 \end{center}
 """
     return table_code
 
 
-def generate_report(beam_df, beam_image_path, output_path):
+def _report_key(beam_df, beam_image_path, quick):
+    """
+    Compute a content hash over everything that shapes the report
+
+    Args:
+        beam_df: DataFrame containing beam analysis data
+        beam_image_path: Path to beam diagram image, or None
+        quick: Whether the table of contents is skipped
+
+    Returns:
+        Hex digest identifying this report's inputs
+    """
+    hasher = hashlib.blake2b(pd.util.hash_pandas_object(beam_df, index=True).values.tobytes())
+    if beam_image_path:
+        with open(beam_image_path, 'rb') as f:
+            hasher.update(f.read())
+    hasher.update(b'quick' if quick else b'full')
+    return hasher.hexdigest()
+
+
+def compile_pdf(tex_path):
+    """
+    Compile a .tex file to PDF
+
+    Prefers latexmk, which runs pdflatex only as many times as needed
+    and skips unchanged auxiliaries between invocations. Falls back to
+    plain pdflatex, rerunning only when the table of contents changed.
+
+    Args:
+        tex_path: Path to the .tex file to compile
+    """
+    tex_dir = os.path.dirname(tex_path) or '.'
+    tex_file = os.path.basename(tex_path)
+    toc_path = os.path.splitext(tex_path)[0] + '.toc'
+
+    if shutil.which('latexmk'):
+        subprocess.run(
+            ['latexmk', '-pdf', '-interaction=nonstopmode', '-synctex=0', '-f', tex_file],
+            cwd=tex_dir, check=True, stdout=subprocess.DEVNULL,
+        )
+        return
+
+    def read_toc():
+        try:
+            with open(toc_path, encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    command = ['pdflatex', '-interaction=nonstopmode', tex_file]
+    toc_before = read_toc()
+    subprocess.run(command, cwd=tex_dir, check=True, stdout=subprocess.DEVNULL)
+    if read_toc() != toc_before:
+        subprocess.run(command, cwd=tex_dir, check=True, stdout=subprocess.DEVNULL)
+
+
+def generate_report(beam_df, beam_image_path, output_path, quick=False):
     """
     Generate the complete PDF report
-    
+
     Args:
         beam_df: DataFrame containing beam analysis data
-        beam_image_path: Path to beam diagram image
+        beam_image_path: Path to beam diagram image, or None to omit the figure
         output_path: Path where PDF should be saved
+        quick: Skip the table of contents so a single pdflatex pass suffices
     """
-    geometry_options = {"margin": "1in"}
-    doc = Document(geometry_options=geometry_options)
-    
-    doc.packages.append(Package('graphicx'))
-    doc.packages.append(Package('pgfplots'))
-    doc.packages.append(Package('tikz'))
-    doc.preamble.append(NoEscape(r'\pgfplotsset{compat=1.18}'))
-    
-    doc.preamble.append(NoEscape(r'\title{Beam Analysis Report \\ Simply Supported Beam}'))
-    doc.preamble.append(NoEscape(r'\author{Generated using PyLaTeX}'))
-    doc.preamble.append(NoEscape(r'\date{\today}'))
-    doc.append(NoEscape(r'\maketitle'))
-    
-    doc.append(NoEscape(r'\tableofcontents'))
-    doc.append(NoEscape(r'\newpage'))
-    
-    with doc.create(Section('Introduction')):
-        doc.append('This report presents the structural analysis of a simply supported beam. ')
-        doc.append('The beam consists of a pinned support on the left end and a roller support on the right end, ')
-        doc.append('allowing for horizontal movement while providing vertical support.')
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        doc.append('The analysis includes the complete shear force distribution and bending moment distribution ')
-        doc.append('along the length of the beam.')
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        doc.append(bold('Data Source: '))
-        doc.append('Analysis data has been imported from the Excel file: Force.xlsx')
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        if os.path.exists(beam_image_path):
-            with doc.create(Figure(position='h!')) as fig:
-                fig.add_image(beam_image_path, width='400px')
-                fig.add_caption('Simply Supported Beam Configuration')
-        
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        beam_length = beam_df['x'].max() - beam_df['x'].min()
-        doc.append(bold('Beam Properties:'))
-        doc.append(NoEscape(r'\par'))
-        doc.append(f'Total Beam Length: {beam_length:.1f} m')
-        doc.append(NoEscape(r'\par'))
-        doc.append(f'Number of Analysis Points: {len(beam_df)}')
-    
-    doc.append(NoEscape(r'\newpage'))
-    
-    with doc.create(Section('Analysis Data')):
-        doc.append('The following table shows the calculated shear force and bending moment values ')
-        doc.append('at various positions along the beam:')
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        doc.append(NoEscape(create_data_table(beam_df)))
-        
-        doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-        
-        max_shear = beam_df['Shear force'].abs().max()
-        max_moment = beam_df['Bending Moment'].max()
-        max_moment_location = beam_df.loc[beam_df['Bending Moment'].idxmax(), 'x']
-        
-        doc.append(bold('Key Analysis Results:'))
-        doc.append(NoEscape(r'\par'))
-        doc.append(f'Maximum Shear Force: {max_shear:.2f} kN')
-        doc.append(NoEscape(r'\par'))
-        doc.append(f'Maximum Bending Moment: {max_moment:.2f} kN·m')
-        doc.append(NoEscape(r'\par'))
-        doc.append(f'Location of Maximum Moment: {max_moment_location:.2f} m from left support')
-    
-    doc.append(NoEscape(r'\newpage'))
-    
-    with doc.create(Section('Structural Analysis Diagrams')):
-        
-        with doc.create(Subsection('Shear Force Diagram (SFD)')):
-            doc.append('The shear force diagram shows the variation of shear force along the length of the beam. ')
-            doc.append('Shear force represents the internal force acting perpendicular to the beam axis.')
-            doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-            
-            x_data = beam_df['x'].tolist()
-            shear_data = beam_df['Shear force'].tolist()
-            
-            doc.append(NoEscape(create_tikz_sfd(x_data, shear_data)))
-            
-            doc.append(NoEscape(r'\par\vspace{0.3cm}'))
-            doc.append(f'The shear force varies from {min(shear_data):.2f} kN to {max(shear_data):.2f} kN along the beam.')
-        
-        doc.append(NoEscape(r'\vspace{1.5cm}'))
-        
-        with doc.create(Subsection('Bending Moment Diagram (BMD)')):
-            doc.append('The bending moment diagram shows the variation of bending moment along the length of the beam. ')
-            doc.append('Bending moment represents the internal moment that causes the beam to bend.')
-            doc.append(NoEscape(r'\par\vspace{0.5cm}'))
-            
-            moment_data = beam_df['Bending Moment'].tolist()
-            
-            doc.append(NoEscape(create_tikz_bmd(x_data, moment_data)))
-            
-            doc.append(NoEscape(r'\par\vspace{0.3cm}'))
-            doc.append(f'The maximum bending moment is {max(moment_data):.2f} kN·m, ')
-            doc.append(f'occurring at {max_moment_location:.2f} m from the left support.')
-    
-    doc.append(NoEscape(r'\newpage'))
-    with doc.create(Section('Conclusion')):
-        doc.append('The structural analysis of the simply supported beam has been completed. ')
-        doc.append('The shear force and bending moment diagrams provide essential information for:')
-        doc.append(NoEscape(r'\par\vspace{0.3cm}'))
-        doc.append(NoEscape(r'\begin{itemize}'))
-        doc.append(NoEscape(r'\item Determining critical sections for design'))
-        doc.append(NoEscape(r'\item Calculating required beam dimensions'))
-        doc.append(NoEscape(r'\item Selecting appropriate materials'))
-        doc.append(NoEscape(r'\item Ensuring structural safety and stability'))
-        doc.append(NoEscape(r'\end{itemize}'))
-        doc.append(NoEscape(r'\par\vspace{0.3cm}'))
-        doc.append('These results form the foundation for detailed structural design and verification.')
-    
+    key = _report_key(beam_df, beam_image_path, quick)
+    key_path = output_path + '.key'
+    if os.path.exists(output_path):
+        try:
+            with open(key_path) as f:
+                if f.read() == key:
+                    print(f"\nReport unchanged, skipping regeneration: {output_path}")
+                    return
+        except OSError:
+            pass
+
+    output_dir = os.path.dirname(output_path) or '.'
+    scratch_dir = tempfile.mkdtemp(
+        prefix='beam-report-',
+        dir='/dev/shm' if os.path.isdir('/dev/shm') else None,
+    )
+
+    beam_length = beam_df['x'].max() - beam_df['x'].min()
+
+    figure_code = ''
+    if beam_image_path:
+        image_path = os.path.abspath(beam_image_path).replace('\\', '/')
+        figure_code = rf"""
+\begin{{figure}}[h!]
+\centering
+\includegraphics[width=400px]{{{image_path}}}
+\caption{{Simply Supported Beam Configuration}}
+\end{{figure}}
+"""
+
+    introduction = rf"""
+\section{{Introduction}}
+This report presents the structural analysis of a simply supported beam.
+The beam consists of a pinned support on the left end and a roller support on the right end,
+allowing for horizontal movement while providing vertical support.
+\par\vspace{{0.5cm}}
+The analysis includes the complete shear force distribution and bending moment distribution
+along the length of the beam.
+\par\vspace{{0.5cm}}
+\textbf{{Data Source: }}Analysis data has been imported from the Excel file: Force.xlsx
+\par\vspace{{0.5cm}}
+{figure_code}
+\par\vspace{{0.5cm}}
+\textbf{{Beam Properties:}}\par
+Total Beam Length: {beam_length:.1f} m\par
+Number of Analysis Points: {len(beam_df)}
+"""
+
+    stats = {
+        'sf_min': beam_df['Shear force'].min(),
+        'sf_max': beam_df['Shear force'].max(),
+        'sf_absmax': beam_df['Shear force'].abs().max(),
+        'bm_max': beam_df['Bending Moment'].max(),
+        'bm_argmax': beam_df['Bending Moment'].idxmax(),
+    }
+    max_moment_location = beam_df.loc[stats['bm_argmax'], 'x']
+
+    analysis_data = rf"""
+\section{{Analysis Data}}
+The following table shows the calculated shear force and bending moment values
+at various positions along the beam:
+\par\vspace{{0.5cm}}
+{create_data_table(beam_df)}
+\par\vspace{{0.5cm}}
+\textbf{{Key Analysis Results:}}\par
+Maximum Shear Force: {stats['sf_absmax']:.2f} kN\par
+Maximum Bending Moment: {stats['bm_max']:.2f} kN·m\par
+Location of Maximum Moment: {max_moment_location:.2f} m from left support
+"""
+
+    x_data = beam_df['x'].to_numpy()
+    shear_data = beam_df['Shear force'].to_numpy()
+    moment_data = beam_df['Bending Moment'].to_numpy()
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        fut_sfd = executor.submit(create_tikz_sfd, x_data, shear_data, os.path.join(scratch_dir, 'sfd.dat'))
+        fut_bmd = executor.submit(create_tikz_bmd, x_data, moment_data, os.path.join(scratch_dir, 'bmd.dat'))
+        sfd_tikz = fut_sfd.result()
+        bmd_tikz = fut_bmd.result()
+
+    diagrams = rf"""
+\section{{Structural Analysis Diagrams}}
+\subsection{{Shear Force Diagram (SFD)}}
+The shear force diagram shows the variation of shear force along the length of the beam.
+Shear force represents the internal force acting perpendicular to the beam axis.
+\par\vspace{{0.5cm}}
+{sfd_tikz}
+\par\vspace{{0.3cm}}
+The shear force varies from {stats['sf_min']:.2f} kN to {stats['sf_max']:.2f} kN along the beam.
+\vspace{{1.5cm}}
+\subsection{{Bending Moment Diagram (BMD)}}
+The bending moment diagram shows the variation of bending moment along the length of the beam.
+Bending moment represents the internal moment that causes the beam to bend.
+\par\vspace{{0.5cm}}
+{bmd_tikz}
+\par\vspace{{0.3cm}}
+The maximum bending moment is {stats['bm_max']:.2f} kN·m,
+occurring at {max_moment_location:.2f} m from the left support.
+"""
+
+    conclusion = r"""
+\section{Conclusion}
+The structural analysis of the simply supported beam has been completed.
+The shear force and bending moment diagrams provide essential information for:
+\par\vspace{0.3cm}
+\begin{itemize}
+\item Determining critical sections for design
+\item Calculating required beam dimensions
+\item Selecting appropriate materials
+\item Ensuring structural safety and stability
+\end{itemize}
+\par\vspace{0.3cm}
+These results form the foundation for detailed structural design and verification.
+"""
+
+    tex_source = (
+        _PREAMBLE
+        + ('' if quick else '\\tableofcontents\n\\newpage\n')
+        + introduction
+        + '\n\\newpage\n'
+        + analysis_data
+        + '\n\\newpage\n'
+        + diagrams
+        + '\n\\newpage\n'
+        + conclusion
+        + '\n\\end{document}\n'
+    )
+
+    tex_path = os.path.join(scratch_dir, 'report.tex')
+    with open(tex_path, 'w', encoding='utf-8') as f:
+        f.write(tex_source)
+
     try:
-        doc.generate_pdf(output_path.replace('.pdf', ''), clean_tex=False)
+        compile_pdf(tex_path)
+        shutil.move(os.path.join(scratch_dir, 'report.pdf'), output_path)
+        with open(key_path, 'w') as f:
+            f.write(key)
         print(f"\nReport successfully generated: {output_path}")
     except Exception as e:
         print(f"\nError generating PDF: {e}")
         print("Make sure you have LaTeX installed (MiKTeX, TeX Live, or MacTeX)")
+        log_path = os.path.join(scratch_dir, 'report.log')
+        if os.path.exists(log_path):
+            shutil.move(log_path, os.path.join(output_dir, 'report.log'))
+            print(f"LaTeX log saved to: {os.path.join(output_dir, 'report.log')}")
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
 
 
 def main():
@@ -269,6 +465,8 @@ def main():
     """
     excel_path = 'data/Force.xlsx'
     beam_image_path = 'images/Beam.png'
+    if not os.path.isfile(beam_image_path):
+        beam_image_path = None
     output_path = 'output/report.pdf'
     
     os.makedirs('output', exist_ok=True)